@@ -21,26 +21,84 @@ Usage:
 
 import argparse
 import asyncio
+import hashlib
+import heapq
+import json
+import operator
+import os
+import random
+import re
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
 
 import httpx
 
+# orjson is an optional, faster drop-in for JSON decoding
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# uvloop is an optional, faster event loop (Linux/macOS only)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Polymarket API endpoints
 GAMMA_API = "https://gamma-api.polymarket.com"
 CLOB_API = "https://clob.polymarket.com"
 
+# Market fields read by the tracker, everything else is dropped on fetch
+MARKET_FIELDS = (
+    "id",
+    "conditionId",
+    "question",
+    "slug",
+    "market_slug",
+    "endDate",
+    "end_date_iso",
+    "outcomePrices",
+    "volume",
+    "volumeNum",
+    "liquidity",
+    "liquidityNum",
+    "groupItemTitle",
+    "category",
+    "closed",
+)
+
+# Categories that get less attention, and so less efficient pricing
+_CAT_RE = re.compile(r"obscure|international|minor", re.IGNORECASE)
+
+# On-disk response cache, shared across runs
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "polymarket-moonshot"
+)
+
 
 class RiskTier(Enum):
-    YOLO = "YOLO"  # 1000x+ potential, mass extinction event odds
-    MOONSHOT = "MOONSHOT"  # 100-1000x, genuine longshot
-    LONGSHOT = "LONGSHOT"  # 20-100x, unlikely but possible
-    VALUE = "VALUE"  # 5-20x, underpriced favorite upset
+    YOLO = ("YOLO", "[YOLO]")  # 1000x+ potential, mass extinction event odds
+    MOONSHOT = ("MOONSHOT", "[MOON]")  # 100-1000x, genuine longshot
+    LONGSHOT = ("LONGSHOT", "[LONG]")  # 20-100x, unlikely but possible
+    VALUE = ("VALUE", "[VAL] ")  # 5-20x, underpriced favorite upset
+
+    def __new__(cls, value: str, icon: str):
+        # Value stays the plain tier name, the dashboard icon rides along
+        tier = object.__new__(cls)
+        tier._value_ = value
+        tier.icon = icon
+        return tier
 
 
-@dataclass
+@dataclass(slots=True)
 class MoonshotOpportunity:
     market_id: str
     question: str
@@ -56,9 +114,10 @@ class MoonshotOpportunity:
     edge_score: float
     category: Optional[str] = None
     reasoning: str = ""
+    url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CompoundStrategy:
     starting_capital: float
     target: float
@@ -70,24 +129,214 @@ class CompoundStrategy:
     positions: list = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class Position:
+    market_id: str
+    question: str
+    side: str
+    price: float
+    allocation: float
+    shares: float
+    potential_value: float
+    potential_multiplier: float
+    edge_score: float
+    risk_tier: str
+    days_left: float
+    url: str
+
+
+def _slim_market(market: dict) -> dict:
+    """Keep only MARKET_FIELDS of a raw Gamma market."""
+    return {k: market[k] for k in MARKET_FIELDS if k in market}
+
+
+def _slim_markets(page: list[dict]) -> list[dict]:
+    return [_slim_market(m) for m in page]
+
+
 class PolymarketClient:
     """Async client for Polymarket's public APIs."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+    # Per-host concurrency cap and retry policy
+    MAX_CONCURRENCY = 64
+    MAX_RETRIES = 5
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Upper bound on a server-requested wait, in seconds
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, cache_ttl: float = 600.0):
+        # Seconds a cached response is served without revalidation, 0 disables
+        self.cache_ttl = cache_ttl
+        # One client per host, HTTP/2 multiplexes concurrent requests over
+        # a single warm connection to each
+        client_kwargs = dict(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        )
+        self.gamma = httpx.AsyncClient(base_url=GAMMA_API, **client_kwargs)
+        self.clob = httpx.AsyncClient(base_url=CLOB_API, **client_kwargs)
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        # Monotonic time before which no new request is sent
+        self._resume_at = 0.0
 
     async def close(self):
-        await self.client.aclose()
+        await asyncio.gather(self.gamma.aclose(), self.clob.aclose())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """GET with a concurrency cap, retrying 429/5xx with exponential backoff."""
+        for attempt in range(self.MAX_RETRIES):
+            async with self._sem:
+                wait = self._resume_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                try:
+                    resp = await client.get(path, params=params, headers=headers)
+                except httpx.TransportError:
+                    if attempt == self.MAX_RETRIES - 1:
+                        raise
+                    resp = None
+
+            if resp is not None:
+                retryable = resp.status_code in self.RETRY_STATUSES
+                if not retryable or attempt == self.MAX_RETRIES - 1:
+                    self._pace(resp)
+                    # 304 answers a conditional cache revalidation
+                    if resp.status_code != 304:
+                        resp.raise_for_status()
+                    return resp
+
+            delay = self._retry_after(resp)
+            if delay is None:
+                delay = 2**attempt + random.random()
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+            await asyncio.sleep(delay)
+
+    def _pace(self, resp: httpx.Response):
+        """Hold back new sends when the server reports an exhausted quota."""
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            delay = self._retry_after(resp) or 1.0
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict,
+        transform: Optional[Callable] = None,
+    ):
+        """GET a JSON body, served from the disk cache while fresh.
+
+        Stale entries are revalidated with If-None-Match / If-Modified-Since
+        so an unchanged response costs a 304 instead of a full download.
+        `transform` is applied to the decoded body before it is cached.
+        """
+        if self.cache_ttl <= 0:
+            data = _json_loads((await self._get(client, path, params)).content)
+            return transform(data) if transform else data
+
+        # Transformed bodies are cached under their own key
+        key = json.dumps(
+            [
+                str(client.base_url),
+                path,
+                sorted(params.items()),
+                transform.__name__ if transform else None,
+            ]
+        )
+        cache_path = CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+        entry = self._read_cache(cache_path)
+
+        if entry and time.time() - entry["fetched_at"] < self.cache_ttl:
+            return entry["data"]
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = await self._get(client, path, params, headers=headers)
+        if resp.status_code == 304 and entry:
+            entry["fetched_at"] = time.time()
+        else:
+            data = _json_loads(resp.content)
+            entry = {
+                "fetched_at": time.time(),
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "data": transform(data) if transform else data,
+            }
+
+        self._write_cache(cache_path, entry)
+        return entry["data"]
+
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[dict]:
+        try:
+            entry = _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        # Anything not shaped like an entry we wrote counts as a miss
+        if (
+            not isinstance(entry, dict)
+            or not isinstance(entry.get("fetched_at"), (int, float))
+            or "data" not in entry
+        ):
+            return None
+
+        return entry
+
+    @staticmethod
+    def _write_cache(path: Path, entry: dict):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _retry_after(cls, resp: Optional[httpx.Response]) -> Optional[float]:
+        if resp is None:
+            return None
+        try:
+            delay = float(resp.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+        return min(max(delay, 0.0), cls.MAX_RETRY_DELAY)
 
     async def get_markets(
         self,
         limit: int = 500,
+        offset: int = 0,
         active: bool = True,
         closed: bool = False,
     ) -> list[dict]:
-        """Fetch markets from Gamma API."""
+        """Fetch markets from Gamma API, slimmed to MARKET_FIELDS.
+
+        The page is trimmed right after it is decoded, before it is cached,
+        so the disk cache and callers only ever hold slim markets.
+        """
         params = {
             "limit": limit,
+            "offset": offset,
             "active": str(active).lower(),
             "closed": str(closed).lower(),
             "order": "volume",
@@ -95,9 +344,9 @@ class PolymarketClient:
         }
 
         try:
-            resp = await self.client.get(f"{GAMMA_API}/markets", params=params)
-            resp.raise_for_status()
-            return resp.json()
+            return await self._get_json(
+                self.gamma, "/markets", params, transform=_slim_markets
+            )
         except httpx.HTTPError as e:
             print(f"Error fetching markets: {e}")
             return []
@@ -113,13 +362,37 @@ class PolymarketClient:
         }
 
         try:
-            resp = await self.client.get(f"{GAMMA_API}/events", params=params)
-            resp.raise_for_status()
-            return resp.json()
+            return await self._get_json(self.gamma, "/events", params)
         except httpx.HTTPError as e:
             print(f"Error fetching events: {e}")
             return []
 
+    async def get_event_markets(self, limit: int = 200) -> list[dict]:
+        """Fetch the markets nested in top events, slimmed to MARKET_FIELDS."""
+        events = await self.get_events(limit=limit)
+        return [_slim_market(m) for e in events for m in e.get("markets") or []]
+
+
+@lru_cache(maxsize=4096)
+def _parse_end_ts(value: str) -> Optional[float]:
+    """Parse an ISO end date to a UTC timestamp, or None if malformed.
+
+    Memoized since the markets of one event share the same end date.
+    """
+    # Handle various date formats
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+
+    try:
+        end_date = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+
+    return end_date.timestamp()
+
 
 class MoonshotTracker:
     """Find moonshot opportunities on Polymarket."""
@@ -130,54 +403,89 @@ class MoonshotTracker:
     CATEGORY_WEIGHT = 0.2
     LIQUIDITY_WEIGHT = 0.3
 
+    # Markets requested per Gamma API page
+    PAGE_SIZE = 500
+
     def __init__(self, client: PolymarketClient):
         self.client = client
 
+    async def fetch_markets(self, max_markets: int = 2000) -> list[dict]:
+        """Fetch market pages and events concurrently, deduped by market id."""
+        tasks = [
+            self.client.get_markets(limit=self.PAGE_SIZE, offset=offset)
+            for offset in range(0, max_markets, self.PAGE_SIZE)
+        ]
+        tasks.append(self.client.get_event_markets())
+
+        pages = await asyncio.gather(*tasks, return_exceptions=True)
+
+        markets = []
+        seen = set()
+        for page in pages:
+            if isinstance(page, BaseException):
+                print(f"Error fetching markets: {page}")
+                continue
+
+            for market in page:
+                market_id = market.get("id") or market.get("conditionId")
+                if not market_id or market_id in seen or market.get("closed"):
+                    continue
+                seen.add(market_id)
+                markets.append(market)
+
+        return markets
+
     async def find_moonshots(
         self,
         max_price: float = 0.05,
         min_volume: float = 10000,
         min_days: float = 1,
         max_results: int = 50,
+        max_markets: int = 2000,
     ) -> list[MoonshotOpportunity]:
         """Find cheap longshot opportunities."""
-        markets = await self.client.get_markets(limit=500)
-        opportunities = []
+        markets = await self.fetch_markets(max_markets)
+        opportunities = self._score_markets(
+            markets, max_price, min_volume, min_days, time.time()
+        )
 
-        now = datetime.now(timezone.utc)
+        # Top results by edge score, without sorting every opportunity
+        return heapq.nlargest(
+            max_results, opportunities, key=operator.attrgetter("edge_score")
+        )
 
+    def _score_markets(
+        self,
+        markets: list[dict],
+        max_price: float,
+        min_volume: float,
+        min_days: float,
+        now_ts: float,
+    ) -> list[MoonshotOpportunity]:
+        """Filter and score raw markets into opportunities."""
+        opportunities = []
+
+        # Filters run cheapest first: most markets fail the price check,
+        # so they never reach date parsing or scoring
         for market in markets:
             try:
-                # Parse market data
-                end_date_str = market.get("endDate") or market.get("end_date_iso")
-                if not end_date_str:
-                    continue
-
-                # Handle various date formats
-                if end_date_str.endswith("Z"):
-                    end_date = datetime.fromisoformat(
-                        end_date_str.replace("Z", "+00:00")
-                    )
-                else:
-                    end_date = datetime.fromisoformat(end_date_str)
-
-                if end_date.tzinfo is None:
-                    end_date = end_date.replace(tzinfo=timezone.utc)
-
-                days_left = (end_date - now).total_seconds() / 86400
-
-                if days_left < min_days:
-                    continue
-
                 # Get prices
                 outcome_prices = market.get("outcomePrices")
                 if not outcome_prices:
                     continue
 
                 if isinstance(outcome_prices, str):
-                    import json
-
-                    outcome_prices = json.loads(outcome_prices)
+                    # Gamma encodes prices as '["0.97", "0.03"]', split that shape
+                    # directly and only JSON-decode anything else
+                    parts = outcome_prices[2:-2].split('", "')
+                    if (
+                        len(parts) == 2
+                        and outcome_prices[:2] == '["'
+                        and outcome_prices[-2:] == '"]'
+                    ):
+                        outcome_prices = parts
+                    else:
+                        outcome_prices = _json_loads(outcome_prices)
 
                 if not outcome_prices or len(outcome_prices) < 2:
                     continue
@@ -200,68 +508,80 @@ class MoonshotTracker:
                 if volume < min_volume:
                     continue
 
+                end_date_str = market.get("endDate") or market.get("end_date_iso")
+                if not end_date_str:
+                    continue
+
+                end_ts = _parse_end_ts(end_date_str)
+                if end_ts is None:
+                    continue
+
+                days_left = (end_ts - now_ts) / 86400
+
+                if days_left < min_days:
+                    continue
+
                 liquidity = float(
                     market.get("liquidity") or market.get("liquidityNum") or 0
                 )
+                category = market.get("groupItemTitle") or market.get("category")
+                slug = market.get("slug") or market.get("market_slug") or ""
 
                 # Calculate opportunity metrics
                 multiplier = 1.0 / price
-                edge_score = self._calculate_edge_score(market, volume, liquidity)
+                edge_score = self._calculate_edge_score(volume, liquidity, category)
                 risk_tier = self._classify_risk(multiplier)
 
                 opp = MoonshotOpportunity(
                     market_id=market.get("id") or market.get("conditionId") or "",
                     question=market.get("question") or "",
-                    slug=market.get("slug") or market.get("market_slug") or "",
+                    slug=slug,
                     side=cheap_side,
                     price=price,
                     potential_multiplier=multiplier,
                     volume=volume,
                     liquidity=liquidity,
                     days_to_expiry=days_left,
-                    end_date=end_date,
+                    end_date=datetime.fromtimestamp(end_ts, timezone.utc),
                     risk_tier=risk_tier,
                     edge_score=edge_score,
-                    category=market.get("groupItemTitle") or market.get("category"),
+                    category=category,
                     reasoning=self._generate_reasoning(market, edge_score, volume),
+                    url=f"https://polymarket.com/event/{slug}",
                 )
                 opportunities.append(opp)
 
             except (ValueError, TypeError, KeyError) as e:
                 continue
 
-        # Sort by edge score
-        opportunities.sort(key=lambda x: x.edge_score, reverse=True)
-        return opportunities[:max_results]
+        return opportunities
 
     def _calculate_edge_score(
-        self, market: dict, volume: float, liquidity: float
+        self, volume: float, liquidity: float, category: Optional[str]
     ) -> float:
         """Calculate edge score (higher = better opportunity)."""
-        score = 50.0
-
         # Lower volume = potentially less efficient = edge
         if volume < 50000:
-            score += 15
+            volume_bonus = 15
         elif volume < 100000:
-            score += 10
+            volume_bonus = 10
         elif volume > 1000000:
-            score -= 10
+            volume_bonus = -10
+        else:
+            volume_bonus = 0
 
         # Low liquidity = potential edge
         if liquidity < 10000:
-            score += 10
+            liquidity_bonus = 10
         elif liquidity < 50000:
-            score += 5
+            liquidity_bonus = 5
+        else:
+            liquidity_bonus = 0
 
         # Check for obscure category
-        category = market.get("groupItemTitle") or market.get("category") or ""
-        if category and any(
-            x in category.lower() for x in ["obscure", "international", "minor"]
-        ):
-            score += 10
+        category_bonus = 10 if category and _CAT_RE.search(category) else 0
 
-        return min(max(score, 0), 100)
+        return min(max(50.0 + volume_bonus + liquidity_bonus + category_bonus, 0), 100)
 
     def _classify_risk(self, multiplier: float) -> RiskTier:
         if multiplier >= 1000:
@@ -289,6 +609,22 @@ class MoonshotTracker:
         return " | ".join(parts) if parts else "standard opportunity"
 
 
+@lru_cache(maxsize=128)
+def _calculate_strategy_impl(
+    starting_capital: float, target: float, max_stages: int
+) -> tuple[float, int, float]:
+    """Return (required multiplier, stages, per-stage multiplier)."""
+    required_multiplier = target / starting_capital
+
+    for stages in range(1, max_stages + 1):
+        per_stage = required_multiplier ** (1 / stages)
+
+        if per_stage <= 50:
+            return required_multiplier, stages, per_stage
+
+    return required_multiplier, max_stages, required_multiplier ** (1 / max_stages)
+
+
 class CompoundCalculator:
     """Calculate compound betting strategy."""
 
@@ -298,27 +634,17 @@ class CompoundCalculator:
         target: float,
         max_stages: int = 5,
     ) -> CompoundStrategy:
-        required_multiplier = target / starting_capital
-
-        for stages in range(1, max_stages + 1):
-            per_stage = required_multiplier ** (1 / stages)
-
-            if per_stage <= 50:
-                return CompoundStrategy(
-                    starting_capital=starting_capital,
-                    target=target,
-                    required_multiplier=required_multiplier,
-                    recommended_stages=stages,
-                    per_stage_multiplier=per_stage,
-                    current_capital=starting_capital,
-                )
+        required_multiplier, stages, per_stage = _calculate_strategy_impl(
+            starting_capital, target, max_stages
+        )
 
+        # Fresh instance per call, strategies are mutated as stages progress
         return CompoundStrategy(
             starting_capital=starting_capital,
             target=target,
             required_multiplier=required_multiplier,
-            recommended_stages=max_stages,
-            per_stage_multiplier=required_multiplier ** (1 / max_stages),
+            recommended_stages=stages,
+            per_stage_multiplier=per_stage,
             current_capital=starting_capital,
         )
 
@@ -354,7 +680,7 @@ class CompoundCalculator:
         capital: float,
         target_multiplier: float,
         max_positions: int = 10,
-    ) -> list[dict]:
+    ) -> list[Position]:
         viable = [
             o
             for o in opportunities
@@ -364,31 +690,32 @@ class CompoundCalculator:
         if not viable:
             viable = opportunities[:max_positions]
 
-        positions = []
         allocation_per_position = capital / min(len(viable), max_positions)
 
-        for opp in viable[:max_positions]:
-            shares = allocation_per_position / opp.price
-            potential_value = shares * 1.0
-
-            positions.append(
-                {
-                    "market_id": opp.market_id,
-                    "question": opp.question[:60],
-                    "side": opp.side,
-                    "price": opp.price,
-                    "allocation": allocation_per_position,
-                    "shares": shares,
-                    "potential_value": potential_value,
-                    "potential_multiplier": potential_value / allocation_per_position,
-                    "edge_score": opp.edge_score,
-                    "risk_tier": opp.risk_tier.value,
-                    "days_left": opp.days_to_expiry,
-                    "url": f"https://polymarket.com/event/{opp.slug}",
-                }
+        # A winning share pays out $1
+        return [
+            Position(
+                market_id=opp.market_id,
+                question=opp.question[:60],
+                side=opp.side,
+                price=opp.price,
+                allocation=allocation_per_position,
+                shares=allocation_per_position / opp.price,
+                potential_value=allocation_per_position / opp.price,
+                potential_multiplier=1.0 / opp.price,
+                edge_score=opp.edge_score,
+                risk_tier=opp.risk_tier.value,
+                days_left=opp.days_to_expiry,
+                url=opp.url,
             )
+            for opp in viable[:max_positions]
+        ]
 
-        return positions
+
+def _write_lines(lines: list[str]):
+    """Write buffered lines to stdout in one call and clear the buffer."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
 
 
 async def run_moonshot_dashboard(
@@ -396,81 +723,79 @@ async def run_moonshot_dashboard(
     target: float = 100000.0,
     max_price: float = 0.05,
     min_volume: float = 10000,
+    max_markets: int = 2000,
+    cache_ttl: float = 600.0,
 ):
     """Run the moonshot tracker dashboard."""
-    client = PolymarketClient()
+    # Output is collected and written once per phase, not line by line
+    out = []
 
-    try:
+    async with PolymarketClient(cache_ttl=cache_ttl) as client:
         tracker = MoonshotTracker(client)
 
         # Calculate strategy
         strategy = CompoundCalculator.calculate_strategy(starting_capital, target)
         stage_targets = CompoundCalculator.get_stage_targets(strategy)
 
-        print("\n" + "=" * 70)
-        print("MOONSHOT TRACKER - $50 -> $100K CHALLENGE")
-        print("=" * 70)
+        out.append("\n" + "=" * 70)
+        out.append("MOONSHOT TRACKER - $50 -> $100K CHALLENGE")
+        out.append("=" * 70)
 
-        print(f"\nCOMPOUND STRATEGY")
-        print(f"   Starting: ${starting_capital:,.2f}")
-        print(f"   Target: ${target:,.2f}")
-        print(f"   Required: {strategy.required_multiplier:,.0f}x total")
-        print(f"   Stages: {strategy.recommended_stages}")
-        print(f"   Per stage: {strategy.per_stage_multiplier:.1f}x")
+        out.append(f"\nCOMPOUND STRATEGY")
+        out.append(f"   Starting: ${starting_capital:,.2f}")
+        out.append(f"   Target: ${target:,.2f}")
+        out.append(f"   Required: {strategy.required_multiplier:,.0f}x total")
+        out.append(f"   Stages: {strategy.recommended_stages}")
+        out.append(f"   Per stage: {strategy.per_stage_multiplier:.1f}x")
 
-        print(f"\nSTAGE BREAKDOWN")
+        out.append(f"\nSTAGE BREAKDOWN")
         for t in stage_targets:
             status_icon = (
                 "[X]"
                 if t["status"] == "COMPLETED"
                 else ("[>]" if t["status"] == "CURRENT" else "[ ]")
             )
-            print(
+            out.append(
                 f"   {status_icon} Stage {t['stage']}: "
                 f"${t['start']:,.2f} -> ${t['target']:,.2f} ({t['multiplier_needed']:.1f}x)"
             )
 
         # Find opportunities
-        print(f"\nSCANNING FOR MOONSHOTS...")
+        out.append(f"\nSCANNING FOR MOONSHOTS...")
+        _write_lines(out)
+
         opportunities = await tracker.find_moonshots(
             max_price=max_price,
             min_volume=min_volume,
+            max_markets=max_markets,
         )
 
         if not opportunities:
-            print("\nNo opportunities found matching criteria.")
-            print("Try adjusting --max-price or --min-volume")
+            out.append("\nNo opportunities found matching criteria.")
+            out.append("Try adjusting --max-price or --min-volume")
+            _write_lines(out)
             return
 
-        print(f"\nTOP OPPORTUNITIES (by edge score)")
-        print("-" * 70)
-
-        tier_icons = {
-            RiskTier.YOLO: "[YOLO]",
-            RiskTier.MOONSHOT: "[MOON]",
-            RiskTier.LONGSHOT: "[LONG]",
-            RiskTier.VALUE: "[VAL] ",
-        }
+        out.append(f"\nTOP OPPORTUNITIES (by edge score)")
+        out.append("-" * 70)
 
         for i, opp in enumerate(opportunities[:15], 1):
-            tier_icon = tier_icons[opp.risk_tier]
-
-            print(
-                f"{i:2}. {tier_icon} ${opp.price:.4f} -> {opp.potential_multiplier:,.0f}x"
+            out.append(
+                f"{i:2}. {opp.risk_tier.icon} ${opp.price:.4f} -> {opp.potential_multiplier:,.0f}x"
             )
-            print(
+            out.append(
                 f"    Edge: {opp.edge_score:.0f}/100 | Vol: ${opp.volume:,.0f} | {opp.days_to_expiry:.0f}d"
             )
-            print(f"    {opp.question[:65]}")
-            print(f"    https://polymarket.com/event/{opp.slug}")
-            print()
+            out.append(f"    {opp.question[:65]}")
+            out.append(f"    {opp.url}")
+            out.append("")
 
         # Recommend positions
-        print(
+        out.append(
             f"\nRECOMMENDED POSITIONS FOR STAGE 1 "
             f"(${starting_capital} -> ${starting_capital * strategy.per_stage_multiplier:.0f})"
         )
-        print("-" * 70)
+        out.append("-" * 70)
 
         positions = CompoundCalculator.recommend_positions(
             opportunities,
@@ -480,31 +805,29 @@ async def run_moonshot_dashboard(
         )
 
         for pos in positions:
-            print(f"   ${pos['allocation']:.2f} -> {pos['side']} @ ${pos['price']:.4f}")
-            print(
-                f"   {pos['shares']:.1f} shares -> potential ${pos['potential_value']:.2f} "
-                f"({pos['potential_multiplier']:.0f}x)"
+            out.append(f"   ${pos.allocation:.2f} -> {pos.side} @ ${pos.price:.4f}")
+            out.append(
+                f"   {pos.shares:.1f} shares -> potential ${pos.potential_value:.2f} "
+                f"({pos.potential_multiplier:.0f}x)"
             )
-            print(f"   {pos['question']}")
-            print(f"   {pos['url']}")
-            print()
+            out.append(f"   {pos.question}")
+            out.append(f"   {pos.url}")
+            out.append("")
 
-        total_potential = sum(p["potential_value"] for p in positions)
-        print(f"   TOTAL POTENTIAL: ${total_potential:,.2f} (if ONE hits)")
+        total_potential = sum(p.potential_value for p in positions)
+        out.append(f"   TOTAL POTENTIAL: ${total_potential:,.2f} (if ONE hits)")
 
         # Summary
-        print("\n" + "=" * 70)
-        print("REALITY CHECK")
-        print("=" * 70)
-        print(f"   * You're betting on {len(positions)} longshots")
-        print(f"   * Most will lose (that's why they're cheap)")
-        print(f"   * If ANY ONE hits, you profit")
-        print(f"   * If none hit, you lose ${starting_capital}")
-        print(f"   * This is gambling, not investing")
-        print("=" * 70)
-
-    finally:
-        await client.close()
+        out.append("\n" + "=" * 70)
+        out.append("REALITY CHECK")
+        out.append("=" * 70)
+        out.append(f"   * You're betting on {len(positions)} longshots")
+        out.append(f"   * Most will lose (that's why they're cheap)")
+        out.append(f"   * If ANY ONE hits, you profit")
+        out.append(f"   * If none hit, you lose ${starting_capital}")
+        out.append(f"   * This is gambling, not investing")
+        out.append("=" * 70)
+        _write_lines(out)
 
 
 def main():
@@ -518,6 +841,8 @@ Examples:
     python moonshot.py --target 50000       # Target $50k
     python moonshot.py --max-price 0.10     # Look at up to 10 cent contracts
     python moonshot.py --min-volume 50000   # Only markets with $50k+ volume
+    python moonshot.py --max-markets 5000   # Scan the top 5000 markets
+    python moonshot.py --cache-ttl 0        # Always refetch from the API
         """,
     )
 
@@ -549,15 +874,32 @@ Examples:
         default=10000.0,
         help="Minimum market volume in USD (default: 10000)",
     )
+    parser.add_argument(
+        "--max-markets",
+        "-m",
+        type=int,
+        default=2000,
+        help="Number of markets to scan, fetched concurrently (default: 2000)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=600.0,
+        help="Seconds to reuse cached API responses, 0 to disable (default: 600)",
+    )
 
     args = parser.parse_args()
 
-    asyncio.run(
+    # uvloop.run only exists from uvloop 0.18 on
+    run = getattr(uvloop, "run", None) or asyncio.run
+    run(
         run_moonshot_dashboard(
             starting_capital=args.capital,
             target=args.target,
             max_price=args.max_price,
             min_volume=args.min_volume,
+            max_markets=args.max_markets,
+            cache_ttl=args.cache_ttl,
         )
     )
 